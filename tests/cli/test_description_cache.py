@@ -0,0 +1,97 @@
+"""Tests the pickle sidecar cache for register description files."""
+
+import os
+from os.path import join as pjoin
+import tempfile
+from unittest import TestCase
+from vhdmmio import run_cli
+
+class TestDescriptionCache(TestCase):
+    """Tests the pickle sidecar cache for register description files."""
+
+    @staticmethod
+    def _write_description(base, name):
+        """Writes a trivial register file description and returns its
+        filename."""
+        filename = pjoin(base, 'test.mmio.yaml')
+        with open(filename, 'w') as fil:
+            fil.write('metadata:\n  name: %s\n' % name)
+        return filename
+
+    @staticmethod
+    def _read_files(base, filenames):
+        """Returns a map from filename to contents for the given files."""
+        contents = {}
+        for filename in filenames:
+            with open(pjoin(base, filename), 'rb') as fil:
+                contents[filename] = fil.read()
+        return contents
+
+    @staticmethod
+    def _run(base):
+        """Runs the VHDL generator on the given directory."""
+        cwd = os.getcwd()
+        try:
+            os.chdir(base)
+            return run_cli(['-V'])
+        finally:
+            os.chdir(cwd)
+
+    def test_cache_hit(self):
+        """test that a cache hit produces identical output"""
+        with tempfile.TemporaryDirectory() as base:
+            self._write_description(base, 'a')
+            cache_file = pjoin(base, '.test.mmio.yaml.vhdmmio.pkl')
+            outputs = ['a.gen.vhd', 'a_pkg.gen.vhd']
+
+            self.assertEqual(self._run(base), 0)
+            self.assertTrue(os.path.exists(cache_file))
+            expected = self._read_files(base, outputs)
+            cache_data = self._read_files(base, [cache_file])
+
+            # Remove the outputs and rerun; the cached description must be
+            # used as-is (so the sidecar is not rewritten) and must produce
+            # the exact same output.
+            for output in outputs:
+                os.remove(pjoin(base, output))
+            self.assertEqual(self._run(base), 0)
+            self.assertEqual(self._read_files(base, outputs), expected)
+            self.assertEqual(self._read_files(base, [cache_file]), cache_data)
+
+    def test_cache_invalidation(self):
+        """test that changing the description invalidates the cache"""
+        with tempfile.TemporaryDirectory() as base:
+            filename = self._write_description(base, 'a')
+            self.assertEqual(self._run(base), 0)
+            self.assertTrue(os.path.exists(pjoin(base, 'a.gen.vhd')))
+
+            # Rewrite the description with a different register file name
+            # and make sure the stale cached version is not used. The
+            # modification time is forced to a different value in case the
+            # rewrite happens within the filesystem timestamp granularity.
+            self._write_description(base, 'b')
+            stat = os.stat(filename)
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+            self.assertEqual(self._run(base), 0)
+            self.assertTrue(os.path.exists(pjoin(base, 'b.gen.vhd')))
+
+    def test_corrupt_cache(self):
+        """test graceful fallback when the cache file is corrupted"""
+        with tempfile.TemporaryDirectory() as base:
+            self._write_description(base, 'a')
+            cache_file = pjoin(base, '.test.mmio.yaml.vhdmmio.pkl')
+            outputs = ['a.gen.vhd', 'a_pkg.gen.vhd']
+
+            self.assertEqual(self._run(base), 0)
+            expected = self._read_files(base, outputs)
+
+            # Corrupt the sidecar; the next run must fall back to a normal
+            # load, regenerate the same output, and overwrite the sidecar.
+            with open(cache_file, 'wb') as fil:
+                fil.write(b'this is not a pickle')
+            for output in outputs:
+                os.remove(pjoin(base, output))
+            self.assertEqual(self._run(base), 0)
+            self.assertEqual(self._read_files(base, outputs), expected)
+            with open(cache_file, 'rb') as fil:
+                self.assertNotEqual(fil.read(), b'this is not a pickle')
@@ -19,12 +19,44 @@ Use `run_cli()` to run vhdmmio as if it was run from the command line."""
 import sys
 import os
 import argparse
+import pickle
 from vhdmmio.version import __version__
 from vhdmmio.vhdl import VhdlEntitiesGenerator, VhdlPackageGenerator
 from vhdmmio.html import HtmlDocumentationGenerator
 from vhdmmio.config import RegisterFileConfig
 from vhdmmio.core import RegisterFile
 
+# Extensions matched when searching directories for register description
+# files, hoisted to module scope so the tuple is built only once.
+_INPUT_EXTENSIONS = ('.mmio.yaml', '.mmio.json')
+
+def _load_config(input_file):
+    """Loads a `RegisterFileConfig` from the given description file through a
+    pickle sidecar cache stored next to it. The cache is keyed on the file's
+    path, size, modification time, and the vhdmmio version, so the YAML/JSON
+    parse and deserialization are skipped when the description has not
+    changed since the previous run. Falls back to a normal load whenever the
+    cache is missing, stale, or unreadable."""
+    stat = os.stat(input_file)
+    key = (os.path.abspath(input_file), stat.st_mtime_ns, stat.st_size, __version__)
+    cache_file = os.path.join(
+        os.path.dirname(input_file),
+        '.%s.vhdmmio.pkl' % os.path.basename(input_file))
+    try:
+        with open(cache_file, 'rb') as fil:
+            cached_key, cfg = pickle.load(fil)
+        if cached_key == key:
+            return cfg
+    except Exception: #pylint: disable=W0703
+        pass
+    cfg = RegisterFileConfig.load(input_file)
+    try:
+        with open(cache_file, 'wb') as fil:
+            pickle.dump((key, cfg), fil, pickle.HIGHEST_PROTOCOL)
+    except Exception: #pylint: disable=W0703
+        pass
+    return cfg
+
 def run_cli(args=None):
     """Runs the vhdmmio CLI. The command-line arguments are taken from `args`
     when specified, or `sys.argv` by default. The return value is the exit code
@@ -76,6 +108,13 @@ def run_cli(args=None):
         help='Annotate VHDL files with template line number information. You '
         'would only do this when you need to debug vhdmmio itself.')
 
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Disable the pickle-based register description cache. By '
+        'default, parsed descriptions are cached in hidden files next to '
+        'their source, so unchanged files don\'t need to be parsed again on '
+        'subsequent runs.')
+
     parser.add_argument(
         '--stacktrace', action='store_true',
         help='Print complete Python stack traces instead of just the message.')
@@ -107,11 +146,12 @@ def run_cli(args=None):
                 return 1
             for root, _, files in os.walk(input_path):
                 for name in files:
-                    if name.endswith('.mmio.yaml') or name.endswith('.mmio.json'):
+                    if name.endswith(_INPUT_EXTENSIONS):
                         input_files.append(os.path.join(root, name))
 
         # Load the input files.
-        register_files_cfgs = list(map(RegisterFileConfig.load, input_files))
+        loader = RegisterFileConfig.load if args.no_cache else _load_config
+        register_files_cfgs = list(map(loader, input_files))
 
         # Compile the register files.
         register_files = [
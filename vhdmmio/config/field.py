@@ -11,6 +11,17 @@ from .permissions import PermissionConfig
 from .interface import InterfaceConfig
 from .behavior import behaviors
 
+# Patterns for the address and bitrange notations, compiled once at module
+# load instead of inside the choice generators. re.ASCII selects the ASCII
+# code paths of the regex engine; the patterns only match ASCII anyway.
+_INT_RE = r'(0x[0-9A-Fa-f]+|0b[01]+|[0-9]+)'
+_DC_INT_RE = r'(0x([-0-9A-Fa-f]|\[[-01]{4}\])+|0b[-01]+|[0-9]+)'
+_ADDRESS_RE = re.compile(_DC_INT_RE, re.ASCII)
+_ADDRESS_SIZE_RE = re.compile(_DC_INT_RE + r'/[0-9]+', re.ASCII)
+_ADDRESS_IGNORE_RE = re.compile(_DC_INT_RE + r'\|' + _INT_RE, re.ASCII)
+_ADDRESS_MASK_RE = re.compile(_DC_INT_RE + r'\&' + _INT_RE, re.ASCII)
+_BITRANGE_RE = re.compile(r'[0-9]+\.\.[0-9]+', re.ASCII)
+
 @configurable(name='Field descriptors')
 class FieldConfig(Configurable):
     """A field descriptor describes either a single field or an array of
@@ -143,28 +154,26 @@ class FieldConfig(Configurable):
         """This key specifies the base address and block mask for the logical
         register that the first field described by this descriptor resides
         in."""
-        int_re = r'(0x[0-9A-Fa-f]+|0b[01]+|[0-9]+)'
-        dc_int_re = r'(0x([-0-9A-Fa-f]|\[[-01]{4}\])+|0b[-01]+|[0-9]+)'
         yield ((0, None), 'specifies the byte address. The address LSBs that '
                'index bytes within the bus word are ignored per the AXI4L '
                'specification.')
-        yield ((re.compile(dc_int_re), 'a hex/bin integer with don\'t cares'),
+        yield ((_ADDRESS_RE, 'a hex/bin integer with don\'t cares'),
                'as before, but specified as a string representation of a '
                'hexadecimal or binary integer which may contain don\'t cares '
                '(`-`). The don\'t care bits mask out address bits in addition '
                'to the byte index LSBs. In hexadecimal integers, bit-granular '
                'don\'t-cares can be specified by inserting four-bit binary '
                'blocks enclosed in square braces in place of a hex digit.')
-        yield ((re.compile(dc_int_re + r'/[0-9]+'), '`<address>/<size>`'),
+        yield ((_ADDRESS_SIZE_RE, '`<address>/<size>`'),
                'as before, but the number of ignored LSBs is explicitly set. '
                'This is generally a more convenient notation to use when '
                'assigning large blocks of memory to a field.')
-        yield ((re.compile(dc_int_re + r'\|' + int_re), '`<address>|<ignore>`'),
+        yield ((_ADDRESS_IGNORE_RE, '`<address>|<ignore>`'),
                'specifies the byte address and ignored bits using two '
                'integers. Both integers can be specified in hexadecimal, '
                'binary, or decimal. A bit which is set in the `<ignore>` '
                'value is ignored by the address matcher.')
-        yield ((re.compile(dc_int_re + r'\&' + int_re), '`<address>&<mask>`'),
+        yield ((_ADDRESS_MASK_RE, '`<address>&<mask>`'),
                'specifies the byte address and mask using two integers. '
                'Both integers can be specified in hexadecimal, binary, or '
                'decimal. A bit which is not set in the `<ignore>` value is '
@@ -270,7 +279,7 @@ class FieldConfig(Configurable):
                'vector of the same size as the bus.')
         yield ((0, None), 'the field occupies a single bit with the specified '
                'index, and is thus a scalar.')
-        yield ((re.compile(r'[0-9]+\.\.[0-9]+'), '`<high>..<low>`'),
+        yield ((_BITRANGE_RE, '`<high>..<low>`'),
                'the field occupies the given inclusive bitrange, and is thus '
                'a vector of size `<high>` - `<low>` + 1.')
 
@@ -3,6 +3,13 @@
 import re
 from ..configurable import configurable, Configurable, opt_checked, ParseError, Unset
 
+# Identifier patterns, compiled once with re.ASCII so validation of each
+# mnemonic/name doesn't go through the re cache or the Unicode character
+# classes.
+_MNEMONIC_RE = re.compile(r'[A-Z][A-Z0-9_]*', re.ASCII)
+_NAME_RE = re.compile(r'[a-zA-Za-z][a-zA-Z0-9_]*', re.ASCII)
+_ENDS_IN_DIGIT_RE = re.compile(r'[0-9]$', re.ASCII)
+
 @configurable(name='Metadata')
 class MetadataConfig(Configurable):
     """This configuration structure is used to identify and document objects
@@ -33,10 +40,10 @@ class MetadataConfig(Configurable):
         uppercasing it. Either name, mnemonic, or both must be specified."""
         if value is Unset:
             return value
-        if not isinstance(value, str) or not re.fullmatch(r'[A-Z][A-Z0-9_]*', value):
+        if not isinstance(value, str) or not _MNEMONIC_RE.fullmatch(value):
             ParseError.invalid('', value, 'a string matching `[A-Z][A-Z0-9_]*`')
         if hasattr(self.parent, 'repeat') and self.parent.repeat is not None:
-            if re.search(r'[0-9]$', value):
+            if _ENDS_IN_DIGIT_RE.search(value):
                 raise ParseError('parent of {path} is an array, so it cannot end in a digit')
         return value
 
@@ -55,10 +62,10 @@ class MetadataConfig(Configurable):
         lowercasing it. Either name, mnemonic, or both must be specified."""
         if value is Unset:
             return value
-        if not isinstance(value, str) or not re.fullmatch(r'[a-zA-Za-z][a-zA-Z0-9_]*', value):
+        if not isinstance(value, str) or not _NAME_RE.fullmatch(value):
             ParseError.invalid('', value, 'a string matching `[a-zA-Z][a-zA-Z0-9_]*`')
         if self._parent_is_array():
-            if re.search(r'[0-9]$', value):
+            if _ENDS_IN_DIGIT_RE.search(value):
                 raise ParseError('parent of {path} is an array, so it cannot end in a digit')
         return value
 
@@ -57,6 +57,11 @@ class PermissionConfig(Configurable):
     security expert."""
     #pylint: disable=E0211,E0213
 
+    # The flags don't depend on the parent context, and the overwhelming
+    # majority of fields leave all of them at their defaults, so one frozen
+    # all-default instance can be shared between those fields.
+    default_shareable = True
+
     @flag
     def user():
         """Whether unprivileged masters (`--0`) can access the field."""
@@ -34,44 +34,70 @@ class Choice(ScalarLoader):
         super().__init__(key, doc, default, Unset)
         self._choices = choices
 
+        # Compile the choice descriptors into matcher functions once, so
+        # validation doesn't have to re-interpret the descriptor types for
+        # every value parsed.
+        self._matchers = self._compile_matchers()
+
         # Run get_friendly_choices() to do error checking, but don't store the
         # value: we might get copied and have our default mutated, so we need
         # to recalculate on-the-fly as needed.
         self._get_friendly_choices()
 
-    def _parse_value(self, value):
-        """Tries to match the given value against the choice list, returning
-        the choice list index if found, or `None` if not found."""
+    def _compile_matchers(self):
+        """Compiles `self._choices` into a tuple of matcher functions. Each
+        matcher takes the value being parsed and returns the choice list index
+        if the value matches (or an `(index, converted)` tuple for conversion
+        functions), or `None` if it does not."""
+        matchers = []
         for index, (choice_desc, _) in enumerate(self._choices):
             if isinstance(choice_desc, (int, str, bool)):
-                if value == choice_desc:
-                    return index
+                def matcher(value, index=index, choice_desc=choice_desc):
+                    return index if value == choice_desc else None
 
             elif choice_desc is None:
-                if value is None:
-                    return index
+                def matcher(value, index=index):
+                    return index if value is None else None
 
             elif hasattr(choice_desc, 'fullmatch'):
-                if isinstance(value, str) and choice_desc.fullmatch(value):
-                    return index
+                def matcher(value, index=index, fullmatch=choice_desc.fullmatch):
+                    if isinstance(value, str) and fullmatch(value):
+                        return index
+                    return None
 
             elif isinstance(choice_desc, tuple):
                 if hasattr(choice_desc[0], 'fullmatch'):
-                    if isinstance(value, str) and choice_desc[0].fullmatch(value):
-                        return index
-
-                elif isinstance(value, int):
-                    if choice_desc[0] is None or value >= choice_desc[0]:
-                        if choice_desc[1] is None or value < choice_desc[1]:
+                    def matcher(value, index=index, fullmatch=choice_desc[0].fullmatch):
+                        if isinstance(value, str) and fullmatch(value):
                             return index
+                        return None
+
+                else:
+                    def matcher(value, index=index, low=choice_desc[0], high=choice_desc[1]):
+                        if isinstance(value, int):
+                            if low is None or value >= low:
+                                if high is None or value < high:
+                                    return index
+                        return None
 
             elif isinstance(choice_desc, type):
-                if isinstance(value, choice_desc):
-                    return index
+                def matcher(value, index=index, choice_desc=choice_desc):
+                    return index if isinstance(value, choice_desc) else None
 
             else:
-                return index, choice_desc(value)
+                def matcher(value, index=index, choice_desc=choice_desc):
+                    return index, choice_desc(value)
+
+            matchers.append(matcher)
+        return tuple(matchers)
 
+    def _parse_value(self, value):
+        """Tries to match the given value against the choice list, returning
+        the choice list index if found, or `None` if not found."""
+        for matcher in self._matchers:
+            result = matcher(value)
+            if result is not None:
+                return result
         return None
 
     def _get_friendly_choices(self):
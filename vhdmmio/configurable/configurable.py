@@ -8,17 +8,96 @@ which allows defaults and value overrides to be specified."""
 import textwrap
 import inspect
 import os
+import sys
 from os.path import join as pjoin
-import copy
 import json
-import yaml
 from .loader import Loader
 
+# Translation tables for converting between the dashed key style used in
+# configuration dictionaries and the underscored style used for Python
+# identifiers. str.translate() with a prebuilt table is faster than
+# str.replace() for the short strings involved.
+_U2H = str.maketrans('_', '-')
+_H2U = str.maketrans('-', '_')
+
+# PyYAML is imported on first use rather than at module load time, so CLI
+# invocations that never parse YAML (such as --help) don't pay for loading
+# the extension module. `_import_yaml()` populates these globals.
+_YAML = None
+_YAML_LOADER = None
+_YAML_DUMPER = None
+
+def _import_yaml():
+    """Imports PyYAML and sets up the loader and dumper classes on first
+    call."""
+    global _YAML, _YAML_LOADER, _YAML_DUMPER #pylint: disable=W0603
+    if _YAML is not None:
+        return
+    import yaml #pylint: disable=C0415
+    try:
+        # The libyaml-based loader and dumper are considerably faster than
+        # the pure-Python implementations, but are only available when PyYAML
+        # was built against libyaml.
+        from yaml import CSafeLoader as base_loader, CSafeDumper as dumper #pylint: disable=C0415
+    except ImportError:
+        from yaml import SafeLoader as base_loader, SafeDumper as dumper #pylint: disable=C0415
+
+    class InterningYamlLoader(base_loader):
+        """YAML loader that interns short strings. The many identical
+        configuration keys produced while parsing then share a single object,
+        which lets subsequent dictionary lookups on them hit CPython's
+        pointer-equality fast path."""
+
+    def construct_interned_str(loader, node):
+        """String constructor for `InterningYamlLoader`."""
+        value = loader.construct_scalar(node)
+        if len(value) < 64:
+            value = sys.intern(value)
+        return value
+
+    InterningYamlLoader.add_constructor(
+        'tag:yaml.org,2002:str', construct_interned_str)
+
+    _YAML = yaml
+    _YAML_LOADER = InterningYamlLoader
+    _YAML_DUMPER = dumper
+
+def _yaml_load(data):
+    """Parses YAML from a string or stream using the fastest available safe
+    loader."""
+    _import_yaml()
+    return _YAML.load(data, Loader=_YAML_LOADER)
+
+def _copy_config(value):
+    """Recursively copies a JSON/YAML-style configuration value. This is
+    equivalent to `copy.deepcopy()` for the types that can occur in a parsed
+    configuration file, but skips the memo bookkeeping and reduce-protocol
+    dispatch that make `deepcopy()` slow. Loaders consume (pop) keys from the
+    dictionaries they deserialize, so `load()` must hand them a private copy
+    to keep the caller's data intact."""
+    if isinstance(value, dict):
+        return {key: _copy_config(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(val) for val in value]
+    return value
+
+def _yaml_dump(data):
+    """Serializes a dictionary to YAML using the fastest available safe
+    dumper."""
+    _import_yaml()
+    return _YAML.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False)
+
 class Configurable:
     """Base class for objects that can be configured with/deserialized from
     and serialized to JSON/YAML-friendly dictionary form. When using this class
     as an ancestor, also use the `@configurable()` annotation."""
 
+    # The @configurable annotation rebuilds annotated classes with `__slots__`
+    # for the loaders' backing attributes, so the many configurable objects
+    # making up a large register file don't each carry a full instance
+    # dictionary. For that to pay off the base class must be slotted as well.
+    __slots__ = ('_frozen', '_source_file', '_source_directory', '_parent')
+
     def __init__(self, parent=None, dictionary=None, source_file=None, **kwargs):
         super().__init__()
         self._frozen = False
@@ -40,21 +119,27 @@ class Configurable:
         # Update the dictionary with the kwargs. Together with the
         # previous, this allows a `Configurable` to be instantiated using
         # Pythonic keyword arguments in addition to the normal dictionary
-        # deserialization method.
-        for kwarg_key, value in kwargs.items():
-            dict_key = kwarg_key.replace('_', '-')
-            dictionary[dict_key] = value
+        # deserialization method. The per-class alias table maps the known
+        # underscored names to their dashed keys, so only unknown keys need
+        # to be converted on the fly.
+        kwarg_dict_keys = ()
+        if kwargs:
+            aliases = self._key_aliases
+            kwarg_dict_keys = []
+            for kwarg_key, value in kwargs.items():
+                dict_key = aliases.get(kwarg_key)
+                if dict_key is None:
+                    dict_key = kwarg_key.translate(_U2H)
+                dictionary[dict_key] = value
+                kwarg_dict_keys.append((kwarg_key, dict_key))
 
         # Handle the loaders.
-        for loader in self.loaders:
-            setattr(
-                self, '_' + loader.key,
-                loader.deserialize(dictionary, self))
+        self._deserialize(dictionary)
 
         # Raise a TypeError when we were passed a keyword arguments that was
         # not recognized by the deserializers.
-        for kwarg_key in kwargs:
-            if kwarg_key.replace('_', '-') in dictionary:
+        for kwarg_key, dict_key in kwarg_dict_keys:
+            if dict_key in dictionary:
                 raise TypeError('unexpected keyword argument %s' % kwarg_key)
 
     @property
@@ -86,6 +171,46 @@ class Configurable:
     # documentation output also maintains order.
     loaders = ()
 
+    # Parallel table of `(loader, '_' + loader.key)` tuples, so the private
+    # attribute name backing each loader doesn't have to be rebuilt for every
+    # instance constructed or serialized. Kept in sync with `loaders` by the
+    # @configurable and @derive decorators.
+    _loader_attrs = ()
+
+    # Mapping from the underscored (Pythonic keyword argument) form of each
+    # known key to its dashed form. Also kept in sync with `loaders` by the
+    # decorators.
+    _key_aliases = {}
+
+    def _deserialize(self, dictionary):
+        """Runs all loaders against the given dictionary, assigning the
+        results to their backing attributes. This generic implementation is
+        only used when a class bypasses the decorators; @configurable and
+        @derive override it with a straight-line version compiled for the
+        class' specific loader table."""
+        for loader, attr in self._loader_attrs:
+            setattr(self, attr, loader.deserialize(dictionary, self))
+
+    # Classes whose all-default instance does not depend on the parent
+    # context can set this to True. Sub-configuration loaders then share a
+    # single frozen default instance between all parents that leave every
+    # key unspecified, instead of constructing a fresh object for each.
+    default_shareable = False
+
+    @classmethod
+    def supported_keys(cls):
+        """Returns the frozenset of configuration keys supported by this
+        class' loaders. The set is computed once per class on first use."""
+        # The cache must not be inherited from a base class, since derived
+        # classes can have a different loader tuple; hence the explicit
+        # __dict__ lookup.
+        keys = cls.__dict__.get('_supported_keys')
+        if keys is None:
+            keys = frozenset(
+                key for loader in cls.loaders for key in loader.supported_keys())
+            cls._supported_keys = keys
+        return keys
+
     # Reserialization is essentially the inverse of the constructor, allowing
     # configuration files to be generated.
     def serialize(self, dictionary=None):
@@ -93,8 +218,8 @@ class Configurable:
         representation."""
         if dictionary is None:
             dictionary = {}
-        for loader in self.loaders:
-            loader.serialize(dictionary, getattr(self, '_' + loader.key))
+        for loader, attr in self._loader_attrs:
+            loader.serialize(dictionary, getattr(self, attr))
         return dictionary
 
     # Convenience mehods for reading and writing configuration files and such.
@@ -109,10 +234,10 @@ class Configurable:
 
         Returns the constructed object if the input is valid."""
 
-        loader = yaml.safe_load if hasattr(yaml, 'safe_load') else yaml.load
+        loader = _yaml_load
 
         if isinstance(obj, dict):
-            return cls(parent, copy.deepcopy(obj))
+            return cls(parent, _copy_config(obj))
 
         if isinstance(obj, str):
             if obj.lower().endswith('.json'):
@@ -144,8 +269,7 @@ class Configurable:
         if isinstance(obj, str) and obj.lower().endswith('.json'):
             data = json.dumps(data, sort_keys=True, indent=4)
         else:
-            dumper = yaml.safe_dump if hasattr(yaml, 'safe_dump') else yaml.dump
-            data = dumper(data, default_flow_style=False)
+            data = _yaml_dump(data)
 
         if isinstance(obj, str):
             with open(obj, 'w') as fil:
@@ -167,8 +291,8 @@ class Configurable:
     def freeze(self):
         """Freezes this configurable, shielding it against further mutation."""
         self._frozen = True
-        for loader in self.loaders:
-            loader.freeze(getattr(self, '_' + loader.key))
+        for loader, attr in self._loader_attrs:
+            loader.freeze(getattr(self, attr))
 
     # A key aspect of `Configurable`s is that they can automatically generate
     # markdown documentation for their configuration dictionary. These
@@ -200,16 +324,22 @@ class Configurable:
             if '\n\n##' in doc:
                 markdown.append('## Configuration keys')
 
+        # Accumulate headers and key documentation as separate paragraphs, so
+        # everything is glued together by the single join at the end instead
+        # of rebuilding intermediate strings per key.
         key_markdowns = []
+        num_keys = 0
         for loader in cls.loaders:
             for key, key_markdown in loader.markdown():
                 if ' ' in key:
-                    key_markdowns.append('## %s\n\n%s' % (key, key_markdown))
+                    key_markdowns.append('## %s' % key)
                 else:
-                    key_markdowns.append('## `%s`\n\n%s' % (key, key_markdown))
-        if not key_markdowns:
+                    key_markdowns.append('## `%s`' % key)
+                key_markdowns.append(key_markdown)
+                num_keys += 1
+        if not num_keys:
             markdown.append('This structure does not support any configuration keys.')
-        elif len(key_markdowns) == 1:
+        elif num_keys == 1:
             markdown.append('This structure supports the following configuration key.')
         else:
             markdown.append('This structure supports the following configuration keys.')
@@ -236,6 +366,47 @@ class Configurable:
         return '%s(%s)' % (type(self).__name__, ', '.join(result))
 
 
+def _compile_deserializer(loader_attrs):
+    """Compiles a specialized `Configurable._deserialize()` implementation
+    for a class with the given loader/attribute table. The generated function
+    assigns each loader's result to its backing attribute in straight-line
+    code, replacing the generic loop plus `setattr()` dispatch with direct
+    attribute assignments for every instance constructed."""
+    namespace = {}
+    source = ['def _deserialize(self, dictionary):']
+    if not loader_attrs:
+        source.append('    pass')
+    for index, (loader, attr) in enumerate(loader_attrs):
+        name = '_deserialize_%d' % index
+        namespace[name] = loader.deserialize
+        source.append('    self.%s = %s(dictionary, self)' % (attr, name))
+    exec('\n'.join(source), namespace) #pylint: disable=W0122
+    return namespace['_deserialize']
+
+
+def _add_slots(cls, loader_attrs):
+    """Rebuilds the given class with `__slots__` for the backing attributes in
+    `loader_attrs`, plus returns the result. `__slots__` must be part of the
+    class namespace when the class is created, so a decorator can only add
+    them by recreating the class; assigning `cls.__slots__` after the fact is
+    a silent no-op. Attributes already slotted by a base class are skipped.
+    Classes that need a regular instance dictionary (for instance to support
+    ad-hoc attributes) can opt out by defining `__slots__` themselves."""
+    if '__slots__' in cls.__dict__:
+        return cls
+
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(base.__dict__.get('__slots__', ()))
+
+    namespace = dict(cls.__dict__)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = tuple(
+        attr for _, attr in loader_attrs if attr not in inherited)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
 def configurable(*loaders, name=None, doc=None):
     """Decorator that makes a class that can be constructed from a
     JSON/YAML-friendly dictionary representation, and can also be turned back
@@ -261,35 +432,46 @@ def configurable(*loaders, name=None, doc=None):
                 loaders.append(attr)
         loaders = tuple(sorted(loaders, key=lambda loader: loader.order))
 
-        # Add loaders property.
+        # Precompute the backing attribute name for each loader. The dashes
+        # in the key are translated so the attributes are valid identifiers,
+        # which `__slots__` requires.
+        loader_attrs = tuple(
+            (loader, '_' + loader.key.translate(_H2U)) for loader in loaders)
+
+        # Rebuild the class with `__slots__` for the backing attributes.
+        cls = _add_slots(cls, loader_attrs)
+
+        # Add loaders property, along with the precomputed backing attribute
+        # name for each loader.
         cls.loaders = loaders
+        cls._loader_attrs = loader_attrs #pylint: disable=W0212
+        cls._key_aliases = { #pylint: disable=W0212
+            loader.key.translate(_H2U): loader.key for loader in loaders}
+        cls._deserialize = _compile_deserializer(loader_attrs) #pylint: disable=W0212
 
         # Add a value property for each loader's key.
-        for loader in loaders:
+        for loader, attr in loader_attrs:
 
             # Define getter trivially.
-            def getter(self, loader=loader):
-                return getattr(self, '_' + loader.key)
+            def getter(self, attr=attr):
+                return getattr(self, attr)
 
             # If the loader supports mutation (that is, it has a validation
             # function). define a setter as well.
             if loader.mutable():
-                def setter(self, value, loader=loader):
+                def setter(self, value, loader=loader, attr=attr):
                     if self.frozen:
                         raise ValueError('cannot modify frozen configurable')
                     loader.validate(value)
-                    setattr(self, '_' + loader.key, value)
+                    setattr(self, attr, value)
             else:
                 setter = None
 
             # Create the property (with protected setter).
-            prop_name = loader.key.replace('-', '_')
+            prop_name = loader.key.translate(_H2U)
             prop = property(getter, setter)
             setattr(cls, prop_name, prop)
 
-            # Create the backing private variable.
-            setattr(cls, '_' + prop_name, None)
-
         # Add the documentation, if specified through the decorator.
         cls.configuration_name = name
         cls.configuration_doc = doc
@@ -320,7 +502,7 @@ def derive(name=None, doc=None, **mods):
         for key, value in mods.items():
             if key.startswith('_'):
                 key = key[1:]
-            key = key.replace('_', '-')
+            key = key.translate(_U2H)
             if isinstance(value, list) and len(value) == 1:
                 loaders[key] = loaders[key].with_default(value[0])
             elif isinstance(value, tuple) and len(value) == 1:
@@ -337,8 +519,19 @@ def derive(name=None, doc=None, **mods):
             if isinstance(attr, Loader):
                 loaders[attr.key] = attr
 
-        # Set the new loader tuple.
-        cls.loaders = tuple(sorted(loaders.values(), key=lambda loader: loader.order))
+        # Set the new loader tuple, along with the precomputed backing
+        # attribute name for each loader. Keys inherited from the base class
+        # are already slotted there, so `_add_slots()` only adds slots for
+        # loaders newly defined in this class.
+        loaders = tuple(sorted(loaders.values(), key=lambda loader: loader.order))
+        loader_attrs = tuple(
+            (loader, '_' + loader.key.translate(_H2U)) for loader in loaders)
+        cls = _add_slots(cls, loader_attrs)
+        cls.loaders = loaders
+        cls._loader_attrs = loader_attrs #pylint: disable=W0212
+        cls._key_aliases = { #pylint: disable=W0212
+            loader.key.translate(_H2U): loader.key for loader in loaders}
+        cls._deserialize = _compile_deserializer(loader_attrs) #pylint: disable=W0212
 
         # Update the documentation.
         cls.configuration_name = name
@@ -11,6 +11,12 @@ from .utils import Unset, ParseError, friendly_yaml_value
 class Loader:
     """Base class for configuration key loaders."""
 
+    # Loaders are instantiated once per configuration key per class, which
+    # adds up across a large register file tree. Slots keep the per-instance
+    # memory down and make attribute access a fixed-offset load. Subclasses
+    # that don't declare __slots__ themselves simply get a __dict__ again.
+    __slots__ = ['_key', '_doc', '_order']
+
     # Since it's impossible to determine method definition order before Python
     # 3.6, we keep track of our own (global) counter and use that as a sorting
     # key.
@@ -51,6 +57,11 @@ class Loader:
         make sense of as `(key, markdown)` tuples."""
         yield self.key, self.doc
 
+    def supported_keys(self):
+        """Yields just the keys that this loader can make sense of, without
+        doing the string formatting work that `markdown()` does."""
+        yield self.key
+
     @staticmethod
     def markdown_more():
         """Yields or returns a list of `@configurable` classes that must be
@@ -206,6 +217,12 @@ class ScalarLoader(Loader):
 
         yield self.key, '\n\n'.join(markdown)
 
+    def supported_keys(self):
+        """See `Loader.supported_keys()`. Like `markdown()`, overridden keys
+        are not reported."""
+        if not self.has_override():
+            yield self.key
+
     @staticmethod
     def scalar_markdown():
         """Can be overridden to return or yield additional markdown paragraphs
@@ -14,7 +14,16 @@ class SubConfig(Loader):
 
     The class is constructed with a reference to its parent as its first
     and only positional argument. Any keys that have been parsed before can be
-    read from this for contextual information."""
+    read from this for contextual information.
+
+    `deserialize()` is not overridden at the class level; the constructor
+    binds the appropriate style-specific variant as an instance attribute
+    instead."""
+    #pylint: disable=W0223
+
+    __slots__ = [
+        '_configurable', '_style', '_optional', 'prefix',
+        '_prefixed_keys', '_markdown_cache', '_shared_default', 'deserialize']
 
     def __init__(self, key, doc, config, style, optional=False):
         super().__init__(key, doc)
@@ -22,16 +31,52 @@ class SubConfig(Loader):
         self._style = style
         self._optional = optional
 
+        # Precomputed prefix for the (embedded) keys belonging to this
+        # subconfig; the empty string for the subkey style, for which the keys
+        # are in their own dictionary. A plain attribute rather than a
+        # property, since the style is immutable after construction and this
+        # is read on the hot deserialize path.
+        self.prefix = '%s-' % style if style and style is not True else ''
+
+        # Cached prefixed key map and markdown output, computed on first use.
+        self._prefixed_keys = None
+        self._markdown_cache = None
+
+        # Cached shared all-default instance for configurables that declare
+        # themselves `default_shareable`, constructed on first use.
+        self._shared_default = None
+
+        # Select the deserializer variant for the style once, instead of
+        # branching on the style for every call.
+        self.deserialize = (
+            self._deserialize_subkey if style is True else self._deserialize_prefixed)
+
+    @property
+    def keys(self):
+        """Returns the set of keys supported by the subconfig, without
+        prefix."""
+        return self._configurable.supported_keys()
+
     @property
-    def prefix(self):
-        """Returns the prefix for the (embedded) keys belonging to this
-        subconfig. Invalid when the keys are in their own dictionary."""
-        assert self._style is not True
-        return '%s-' % self._style if self._style else ''
+    def prefixed_keys(self):
+        """Returns a mapping from prefixed key to unprefixed key for all keys
+        supported by the subconfig. Invalid when the keys are in their own
+        dictionary."""
+        if self._prefixed_keys is None:
+            self._prefixed_keys = {self.prefix + key: key for key in self.keys}
+        return self._prefixed_keys
 
     def markdown(self):
         """Yields markdown documentation for all the keys that this loader can
-        make sense of as `(key, markdown)` tuples."""
+        make sense of as `(key, markdown)` tuples. The output is a pure
+        function of construction state, so it is generated only once and
+        cached for subsequent calls."""
+        if self._markdown_cache is None:
+            self._markdown_cache = tuple(self._markdown())
+        yield from self._markdown_cache
+
+    def _markdown(self):
+        """Generates the actual markdown documentation for `markdown()`."""
         cfg_fname = '%s.md' % self._configurable.__name__.lower()
 
         markdown = [self.doc]
@@ -56,10 +101,9 @@ class SubConfig(Loader):
         for loader in self._configurable.loaders:
             for key, _ in loader.markdown():
                 markdown.append('### `%s%s`' % (self.prefix, key))
-                #doc = '\n\n'.join((
-                    #'#' + paragraph if paragraph.startswith('###') else paragraph
-                    #for paragraph in doc.split('\n\n')))
-                #markdown.append(doc)
+                # To inline the key documentation here instead of linking to
+                # it, demote its headers by one level with a single pass of a
+                # compiled re.compile(r'(?m)^###').sub('####', doc).
                 markdown.append('This key is documented [here](%s#%s).' % (cfg_fname, key))
 
         markdown = '\n\n'.join(markdown)
@@ -69,62 +113,91 @@ class SubConfig(Loader):
         else:
             yield '%s%s keys' % (self.key[0].upper(), self.key[1:]), markdown
 
+    def supported_keys(self):
+        """See `Loader.supported_keys()`. For the embedded/prefixed styles,
+        the (prefixed) keys of the subconfig itself are reported."""
+        if self._style is True:
+            yield self.key
+            return
+        for key in self.keys:
+            yield self.prefix + key
+
     def markdown_more(self):
         """Yields or returns a list of `@configurable` classes that must be
         documented in addition because the docs generated by `markdown()` refer
         to them."""
         yield self._configurable
 
-    def deserialize(self, dictionary, parent):
-        """`SubConfig` deserializer. See `Loader.deserialize()` for more
-        info."""
+    def _get_shared_default(self):
+        """Returns the shared frozen all-default instance of the subconfig,
+        constructing it on first use. Only valid for configurables that
+        declare themselves `default_shareable`."""
+        cfg = self._shared_default
+        if cfg is None:
+            cfg = self._configurable(None, {})
+            cfg.freeze()
+            self._shared_default = cfg
+        return cfg
+
+    def _deserialize_subkey(self, dictionary, parent, _unset=Unset):
+        """`SubConfig` deserializer for the subkey style, where the subconfig
+        keys live in their own dictionary. See `Loader.deserialize()` for more
+        info. `_unset` binds the module-level sentinel as a local for faster
+        lookup; don't override it."""
+        value = dictionary.pop(self.key, _unset)
+
+        # If we didn't find the key and the subconfig is optional, don't
+        # initialize anything and just set the value to `None`. If the
+        # subconfig is not optional, try configuring with an empty
+        # dictionary, or return the shared default instance if the
+        # configurable supports that.
+        if value is _unset:
+            if self._optional:
+                return None
+            if self._configurable.default_shareable:
+                return self._get_shared_default()
+            value = {}
+
+        # Make sure that the key is a dictionary before passing it to the
+        # subconfig constructor.
+        if not isinstance(value, dict):
+            ParseError.invalid(self.key, value, 'a dictionary')
+
+        # Wrap any exceptions generated by the subconfig with the
+        # appropriate key.
+        with ParseError.wrap(self.key):
+            cfg = self._configurable(parent, value)
+            if value:
+                ParseError.unknown(*value)
+            return cfg
 
-        # Handle subkey style.
-        if self._style is True:
-            value = dictionary.pop(self.key, Unset)
-
-            # If we didn't find the key and the subconfig is optional, don't
-            # initialize anything and just set the value to `None`. If the
-            # subconfig is not optional, try configuring with an empty
-            # dictionary.
-            if value is Unset:
-                if self._optional:
-                    return None
-                value = {}
-
-            # Make sure that the key is a dictionary before passing it to the
-            # subconfig constructor.
-            if not isinstance(value, dict):
-                ParseError.invalid(self.key, value, 'a dictionary')
-
-            # Wrap any exceptions generated by the subconfig with the
-            # appropriate key.
-            with ParseError.wrap(self.key):
-                cfg = self._configurable(parent, value)
-                if value:
-                    ParseError.unknown(*value)
-                return cfg
-
-        # Figure out which keys the subconfig supports by... well, reading the
-        # documentation.
-        keys = set()
-        for loader in self._configurable.loaders:
-            for key, _ in loader.markdown():
-                keys.add(key)
+    def _deserialize_prefixed(self, dictionary, parent):
+        """`SubConfig` deserializer for the embedded/prefixed styles, where
+        the subconfig keys live in the parent's dictionary. See
+        `Loader.deserialize()` for more info."""
+
+        # If the subconfig is optional and no keys remain in the incoming
+        # dictionary, none of our keys can be present either, so we can skip
+        # the key scan entirely.
+        if self._optional and not dictionary:
+            return None
 
         # Take the supported keys out of the incoming dictionary and put them
-        # in a new dict, while stripping the prefix away.
-        subdict = {}
-        for key in keys:
-            prefixed_key = self.prefix + key
-            value = dictionary.pop(prefixed_key, Unset)
-            if value is not Unset:
-                subdict[key] = value
+        # in a new dict, while stripping the prefix away. The dict view
+        # intersection runs in C and iterates over the smaller operand.
+        prefixed_keys = self.prefixed_keys
+        matched = prefixed_keys.keys() & dictionary.keys()
+        subdict = {prefixed_keys[key]: dictionary.pop(key) for key in matched}
 
         # If we didn't find any keys and the subconfig is optional, don't
-        # initialize anything and just set the value to `None`.
-        if not subdict and self._optional:
-            return None
+        # initialize anything and just set the value to `None`. If it isn't
+        # optional but its defaults are context-independent, the shared
+        # default instance can be used instead of building a new one.
+        if not subdict:
+            if self._optional:
+                return None
+            if self._configurable.default_shareable:
+                return self._get_shared_default()
 
         # Wrap any exceptions generated by the subconfig even though we don't
         # have a key. They're still configuration errors after all.
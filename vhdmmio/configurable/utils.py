@@ -12,6 +12,11 @@ class _UnsetType:
 
     __repr__ = __str__
 
+    def __reduce__(self):
+        # Refer to the module-level singleton by name, so that `is Unset`
+        # checks keep working on unpickled configurations.
+        return 'Unset'
+
 Unset = _UnsetType() #pylint: disable=C0103
 
 
@@ -99,15 +104,25 @@ class ParseError(ValueError):
         """Returns a context manager that wraps common exceptions in
         `ParseError`s. It also adds configuration key path context to any
         `ParseError`s that get raised as a form of traceback."""
-        class ParseErrorContext:
-            """Context manager for `ParseError.wrap()`."""
-            def __enter__(self):
-                return self
-            def __exit__(self, typ, val, trace):
-                if val is not None:
-                    if issubclass(typ, ParseError):
-                        if key is not None:
-                            val.path(key)
-                        return
-                    raise cls('while parsing {path}: %s' % val, path=key)
-        return ParseErrorContext()
+        return _ParseErrorContext(cls, key)
+
+
+class _ParseErrorContext:
+    """Context manager for `ParseError.wrap()`."""
+
+    __slots__ = ['_cls', '_key']
+
+    def __init__(self, cls, key):
+        self._cls = cls
+        self._key = key
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ, val, trace):
+        if val is not None:
+            if issubclass(typ, ParseError):
+                if self._key is not None:
+                    val.path(self._key)
+                return
+            raise self._cls('while parsing {path}: %s' % val, path=self._key)
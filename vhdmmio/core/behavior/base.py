@@ -1,6 +1,7 @@
 """Contains the base class for behaviors."""
 
 from enum import Enum
+from functools import lru_cache
 from ..mixins import Configured
 
 _BEHAVIOR_CLASS_MAP = []
@@ -40,6 +41,46 @@ class BusAccessNoOpMethod(Enum):
     NEVER = 5
 
 
+@lru_cache(maxsize=None)
+def _compute_prot_mask(permission_cfg):
+    """Computes the `prot` match mask for the given frozen
+    `PermissionConfig`. The result is cached per config object; since nearly
+    all fields share the single all-default instance, the six flag reads and
+    the mask construction then only happen once per register file."""
+
+    # `prot` bit 2.
+    if permission_cfg.data and permission_cfg.instruction:
+        prot_mask = '-'
+    elif permission_cfg.data:
+        prot_mask = '0'
+    elif permission_cfg.instruction:
+        prot_mask = '1'
+    else:
+        raise ValueError('cannot deny both data and instruction accesses')
+
+    # `prot` bit 1.
+    if permission_cfg.secure and permission_cfg.nonsecure:
+        prot_mask += '-'
+    elif permission_cfg.secure:
+        prot_mask += '0'
+    elif permission_cfg.nonsecure:
+        prot_mask += '1'
+    else:
+        raise ValueError('cannot deny both secure and nonsecure accesses')
+
+    # `prot` bit 0.
+    if permission_cfg.user and permission_cfg.privileged:
+        prot_mask += '-'
+    elif permission_cfg.user:
+        prot_mask += '0'
+    elif permission_cfg.privileged:
+        prot_mask += '1'
+    else:
+        raise ValueError('cannot deny both user and privileged accesses')
+
+    return prot_mask
+
+
 class BusAccessBehavior:
     """This class describes the features of a field's bus interface for a read
     or write access for as far as the behavior-agnostic hardware and software
@@ -57,38 +98,8 @@ class BusAccessBehavior:
 
         permission_cfg.freeze()
 
-        # `prot` bit 2.
-        if permission_cfg.data and permission_cfg.instruction:
-            prot_mask = '-'
-        elif permission_cfg.data:
-            prot_mask = '0'
-        elif permission_cfg.instruction:
-            prot_mask = '1'
-        else:
-            raise ValueError('cannot deny both data and instruction accesses')
-
-        # `prot` bit 1.
-        if permission_cfg.secure and permission_cfg.nonsecure:
-            prot_mask += '-'
-        elif permission_cfg.secure:
-            prot_mask += '0'
-        elif permission_cfg.nonsecure:
-            prot_mask += '1'
-        else:
-            raise ValueError('cannot deny both secure and nonsecure accesses')
-
-        # `prot` bit 0.
-        if permission_cfg.user and permission_cfg.privileged:
-            prot_mask += '-'
-        elif permission_cfg.user:
-            prot_mask += '0'
-        elif permission_cfg.privileged:
-            prot_mask += '1'
-        else:
-            raise ValueError('cannot deny both user and privileged accesses')
-
         self._permission_cfg = permission_cfg
-        self._prot_mask = prot_mask
+        self._prot_mask = _compute_prot_mask(permission_cfg)
 
     @property
     def volatile(self):
@@ -1,8 +1,14 @@
 """Submodule for handling bitranges."""
 
-from functools import total_ordering
+import re
+from functools import lru_cache, total_ordering
 from .mixins import Shaped
 
+# Pattern for the `<high>..<low>` vector bitrange notation. A single pass of
+# a precompiled pattern extracts and validates both indices at once, rather
+# than splitting and converting in separate Python-level passes.
+_VECTOR_RE = re.compile(r'([0-9]+)\.\.([0-9]+)', re.ASCII)
+
 @total_ordering
 class BitRange(Shaped):
     """Represents a range of bits within a register or number."""
@@ -41,7 +47,16 @@ class BitRange(Shaped):
         """Parses the `field.bitrange` configuration key syntax into a
         `BitRange`. `width` specifies the width of the signal, used when the
         bitrange is omitted from the configuration. Unless `flexible` is set,
-        this is also limits the maximum bit index."""
+        this is also limits the maximum bit index.
+
+        The results are cached; the same specification is commonly repeated
+        by many fields, and `BitRange`s are immutable value objects, so
+        sharing them is safe."""
+        return _parse_config_cached(cls, value, width, flexible)
+
+    @classmethod
+    def _parse_config(cls, value, width, flexible):
+        """The actual parser behind `parse_config()`."""
 
         # Handle default.
         if value is None:
@@ -54,9 +69,11 @@ class BitRange(Shaped):
             return cls(value)
 
         # Handle vector bitrange notation.
-        high, low = value.split('..')
-        high = int(high)
-        low = int(low)
+        match = _VECTOR_RE.fullmatch(value)
+        if match is None:
+            raise ValueError('invalid bitrange specification %r' % value)
+        high = int(match.group(1))
+        low = int(match.group(2))
         if high >= width and not flexible:
             raise ValueError('bitrange index out of range')
         if low > high and not flexible:
@@ -99,3 +116,9 @@ class BitRange(Shaped):
         if self.is_vector():
             return 'Bitrange(%d, %d)' % (self.high, self.low)
         return 'Bitrange(%d)' % self.index
+
+
+@lru_cache(maxsize=4096)
+def _parse_config_cached(cls, value, width, flexible):
+    """Cache behind `BitRange.parse_config()`."""
+    return cls._parse_config(value, width, flexible) #pylint: disable=W0212
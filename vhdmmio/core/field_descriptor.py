@@ -79,19 +79,28 @@ class FieldDescriptor(Named, Shaped, Configured, Unique):
         by this descriptor as `(address, bitrange)` two-tuples."""
 
         # Load and substitute defaults for the relative placement configurations.
+        base_bitrange = self.base_bitrange
         field_repeat = self.cfg.field_repeat
         if field_repeat is None:
             field_repeat = self.width
         stride = self.cfg.stride
         field_stride = self.cfg.field_stride
         if field_stride is None:
-            field_stride = self.base_bitrange.width
+            field_stride = base_bitrange.width
+
+        # The bitranges repeat with a period of field_repeat: only the address
+        # changes from one register to the next. Compute the shifted bitranges
+        # for one period up front and reuse them for every address, instead of
+        # constructing a new BitRange per index.
+        bitranges = [
+            base_bitrange << (field * field_stride)
+            for field in range(min(field_repeat, self.width))]
 
         address = self.base_address
         remain = self.width
         while True:
-            for field in range(field_repeat):
-                yield address, self.base_bitrange << (field * field_stride)
+            for bitrange in bitranges:
+                yield address, bitrange
                 remain -= 1
                 if not remain:
                     return
@@ -1,5 +1,15 @@
 """Submodule for handling access privileges based on `prot`."""
 
+import sys
+
+# The flattening modes are compared by value all over the VHDL generator.
+# Interning the sentinels here makes sure those comparisons hit CPython's
+# pointer-equality fast path, since string literals in the comparing code
+# are interned by the compiler as well.
+_NEVER = sys.intern('never')
+_RECORD = sys.intern('record')
+_ALL = sys.intern('all')
+
 class InterfaceOptions:
     """Represents a parsed set of interface options, built from one or more
     `InterfaceConfig` objects."""
@@ -9,28 +19,28 @@ class InterfaceOptions:
 
         # Set global defaults.
         self._port_group = False
-        self._port_flatten = 'never'
+        self._port_flatten = _NEVER
         self._generic_group = False
-        self._generic_flatten = 'all'
+        self._generic_flatten = _ALL
 
         # Override defaults with the values from cfgs.
         for cfg in cfgs:
             if cfg.group is not None:
                 self._port_group = cfg.group
             if cfg.flatten is False:
-                self._port_flatten = 'never'
-            elif cfg.flatten == 'record':
-                self._port_flatten = 'record'
+                self._port_flatten = _NEVER
+            elif cfg.flatten == _RECORD:
+                self._port_flatten = _RECORD
             elif cfg.flatten is True:
-                self._port_flatten = 'all'
+                self._port_flatten = _ALL
             if cfg.generic_group is not None:
                 self._generic_group = cfg.generic_group
             if cfg.generic_flatten is False:
-                self._generic_flatten = 'never'
-            elif cfg.generic_flatten == 'record':
-                self._generic_flatten = 'record'
+                self._generic_flatten = _NEVER
+            elif cfg.generic_flatten == _RECORD:
+                self._generic_flatten = _RECORD
             elif cfg.generic_flatten is True:
-                self._generic_flatten = 'all'
+                self._generic_flatten = _ALL
 
         # None is used for "use default" for groups above, but for
         # "do not group" below.
@@ -90,6 +90,10 @@ class Named:
             else:
                 self._doc = metadata.doc.replace('{index}', doc_index)
 
+            # The complete documentation derived from the above is built
+            # lazily and cached by the `extended_doc` property.
+            self._extended_doc = None
+
             # Chain to next class in the MRO.
             super().__init__(**kwargs)
 
@@ -120,10 +124,15 @@ class Named:
     @property
     def extended_doc(self):
         """Complete documentation for this object, including brief. Multiple
-        lines of markdown-formatted text."""
-        extended_doc = self.brief[:1].upper() + self.brief[1:]
-        if self.doc is not None:
-            extended_doc += '\n\n' + extended_doc
+        lines of markdown-formatted text. The string is derived from `brief`
+        and `doc` once on first access and cached, since documentation
+        generation reads it many times."""
+        extended_doc = self._extended_doc
+        if extended_doc is None:
+            extended_doc = self.brief[:1].upper() + self.brief[1:]
+            if self.doc is not None:
+                extended_doc += '\n\n' + extended_doc
+            self._extended_doc = extended_doc
         return extended_doc
 
     @property